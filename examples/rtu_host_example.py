@@ -16,26 +16,26 @@ bus address and UART communication speed can be defined by the user.
 """
 
 # system packages
+from micropython import const
 import time
 
 # import modbus host classes
 from umodbus.serial import Serial as ModbusRTUMaster
 
-IS_DOCKER_MICROPYTHON = False
 try:
     import machine
-    machine.reset_cause()
 except ImportError:
     raise Exception('Unable to import machine, are all fakes available?')
-except AttributeError:
-    # machine fake class has no "reset_cause" function
-    IS_DOCKER_MICROPYTHON = True
+
+# machine fake class has no "reset_cause" function
+IS_DOCKER_MICROPYTHON = not hasattr(machine, 'reset_cause')
+if IS_DOCKER_MICROPYTHON:
     import sys
 
 
 # ===============================================
 # RTU Slave setup
-slave_addr = 10             # address on bus of the client/slave
+slave_addr = const(10)      # address on bus of the client/slave
 
 # RTU Master setup
 # act as host, collect Modbus data via RTU from a client device
@@ -44,16 +44,28 @@ slave_addr = 10             # address on bus of the client/slave
 # https://docs.micropython.org/en/latest/library/machine.UART.html
 # for Device/Port specific setup
 #
-# RP2 needs "rtu_pins = (Pin(4), Pin(5))" whereas ESP32 can use any pin
+# RP2 needs "rtu_pins = (4, 5)" with "uart_id = 1" whereas ESP32 can use any pin
 # the following example is for an ESP32
 # For further details check the latest MicroPython Modbus RTU documentation
 # example https://micropython-modbus.readthedocs.io/en/latest/EXAMPLES.html#rtu
 rtu_pins = (25, 26)         # (TX, RX)
-baudrate = 9600
+baudrate = const(9600)
 uart_id = 1
 
+# UART ID and (TX, RX) pins of the supported ports, indexed by os.uname().sysname
+# pins are given as GPIO number or name, the Pin objects are created by umodbus
+_PLATFORM_CFG = {
+    # NOT YET TESTED !
+    # https://docs.micropython.org/en/latest/library/pyb.UART.html#pyb-uart
+    # (TX, RX) = (X9, X10) = (PB6, PB7)
+    'pyboard': (1, ('PB6', 'PB7')),
+    # https://docs.micropython.org/en/latest/esp32/quickref.html#uart-serial-bus
+    'esp32': (1, (25, 26)),
+    # https://docs.micropython.org/en/latest/rp2/quickref.html#uart-serial-bus
+    'rp2': (0, (0, 1)),
+}
+
 try:
-    from machine import Pin
     import os
     from umodbus import version
 
@@ -61,26 +73,16 @@ try:
     print('MicroPython infos: {}'.format(os_info))
     print('Used micropthon-modbus version: {}'.format(version.__version__))
 
-    if 'pyboard' in os_info:
-        # NOT YET TESTED !
-        # https://docs.micropython.org/en/latest/library/pyb.UART.html#pyb-uart
-        # (TX, RX) = (X9, X10) = (PB6, PB7)
-        uart_id = 1
-        # (TX, RX)
-        rtu_pins = (Pin(PB6), Pin(PB7))     # noqa: F821
-    elif 'esp8266' in os_info:
+    sysname = getattr(os_info, 'sysname', '')
+    if sysname == 'esp8266':
         # https://docs.micropython.org/en/latest/esp8266/quickref.html#uart-serial-bus
         raise Exception(
             'UART0 of ESP8266 is used by REPL, UART1 can only be used for TX'
         )
-    elif 'esp32' in os_info:
-        # https://docs.micropython.org/en/latest/esp32/quickref.html#uart-serial-bus
-        uart_id = 1
-        rtu_pins = (25, 26)             # (TX, RX)
-    elif 'rp2' in os_info:
-        # https://docs.micropython.org/en/latest/rp2/quickref.html#uart-serial-bus
-        uart_id = 0
-        rtu_pins = (Pin(0), Pin(1))     # (TX, RX)
+
+    platform_cfg = _PLATFORM_CFG.get(sysname)
+    if platform_cfg is not None:
+        uart_id, rtu_pins = platform_cfg
 except AttributeError:
     pass
 except Exception as e:
@@ -95,6 +97,7 @@ host = ModbusRTUMaster(
     # stop_bits=1,          # optional, default 1
     # parity=None,          # optional, default None
     # ctrl_pin=12,          # optional, control DE/RE
+    # rxbuf=1024,           # optional, UART receive buffer size
     uart_id=uart_id         # optional, default 1, see port specific docs
 )
 
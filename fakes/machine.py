@@ -35,6 +35,7 @@ class UART(object):
                  stop: int = 1,
                  tx: int = 1,
                  rx: int = 2,
+                 rxbuf: int = 256,
                  timeout: int = 0) -> None:
         self._uart_id = uart_id
         if timeout == 0:
@@ -393,7 +394,18 @@ class UART(object):
         :returns:   Number of bytes read and stored in buffer, None on timeout
         :rtype:     Union[None, bytes]
         """
-        raise MachineError('Not yet implemented')
+        if nbytes is None or nbytes > len(buf):
+            nbytes = len(buf)
+
+        data = self.read(nbytes=nbytes)
+        if data is None:
+            return None
+
+        # mock delivers complete frames, drop what does not fit into buffer
+        nbytes = min(len(data), nbytes)
+        buf[:nbytes] = data[:nbytes]
+
+        return nbytes
 
     def readline(self) -> Union[None, str]:
         """
@@ -415,7 +427,8 @@ class UART(object):
         :rtype:     Union[None, int]
         """
         if self._is_server:
-            self._send_queue.put_nowait(buf)
+            # copy the data, the buffer might be reused by the caller
+            self._send_queue.put_nowait(bytes(buf))
         else:
             self._sock.send(buf)
 
@@ -458,7 +471,7 @@ class Pin(object):
     IN = 1
     OUT = 2
 
-    def __init__(self, pin: int, mode: int):
+    def __init__(self, pin: int, mode: Optional[int] = None):
         self._pin = pin
         self._mode = mode
         self._value = False
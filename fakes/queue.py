@@ -12,9 +12,10 @@ This is a temporary solution until uasyncio V3 gets an efficient official
 version
 """
 
-try:
+import sys
+if sys.implementation.name == 'micropython':
     import uasyncio as asyncio
-except ImportError:
+else:
     import asyncio
 
 
@@ -0,0 +1,24 @@
+# MicroPython manifest to freeze the umodbus package as bytecode into a
+# custom firmware, see https://docs.micropython.org/en/latest/reference/manifest.html
+# opt=3 strips asserts and line numbers to keep the frozen bytecode small
+
+# the native code CRC16 module can only be frozen if the mpy-cross flags of
+# the port set -march, enable it with include(..., native_crc16=True)
+options.defaults(native_crc16=False)    # noqa: F821
+
+package("umodbus",      # noqa: F821
+        files=[
+            "__init__.py",
+            "common.py",
+            "const.py",
+            "functions.py",
+            "modbus.py",
+            "serial.py",
+            "tcp.py",
+            "typing.py",
+            "version.py",
+        ],
+        opt=3)
+
+if options.native_crc16:    # noqa: F821
+    package("umodbus", files=["crc16.py"], opt=3)   # noqa: F821
@@ -71,6 +71,7 @@ class TestConst(unittest.TestCase):
         self.assertEqual(Const.ERROR_RESP_LEN, 0x05)
         self.assertEqual(Const.FIXED_RESP_LEN, 0x08)
         self.assertEqual(Const.MBAP_HDR_LENGTH, 0x07)
+        self.assertEqual(Const.MAX_RTU_ADU_LENGTH, 0x100)
 
     def test_crc16_table(self):
         """Test CRC16-Modbus table"""
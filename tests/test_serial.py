@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+"""Unittest for testing the Serial/RTU interface of umodbus"""
+
+import ulogging as logging
+import mpy_unittest as unittest
+from umodbus import serial as serial_module
+from umodbus.serial import Serial
+from umodbus import const as Const
+
+
+class RecordingUART(object):
+    """UART stub recording all written data"""
+    def __init__(self) -> None:
+        self.written = []
+
+    def write(self, buf: bytes) -> int:
+        # copy the data, the buffer is reused by the Serial interface
+        self.written.append(bytes(buf))
+
+        return len(buf)
+
+    def flush(self) -> None:
+        pass
+
+
+class BufferedUART(object):
+    """UART stub providing the given chunks of data to be read"""
+    def __init__(self, chunks: list) -> None:
+        self._chunks = list(chunks)
+
+    def any(self) -> int:
+        return len(self._chunks)
+
+    def read(self, nbytes: int = None) -> bytes:
+        if not self._chunks:
+            return None
+
+        return self._chunks.pop(0)
+
+    def readinto(self, buf: memoryview, nbytes: int = None) -> int:
+        if not self._chunks:
+            return None
+
+        data = self._chunks[0]
+        read_len = min(len(data), len(buf))
+        buf[:read_len] = data[:read_len]
+
+        if read_len < len(data):
+            self._chunks[0] = data[read_len:]
+        else:
+            self._chunks.pop(0)
+
+        return read_len
+
+
+class TestSerial(unittest.TestCase):
+    def setUp(self) -> None:
+        """Run before every test method"""
+        # set basic config and level for the logger
+        logging.basicConfig(level=logging.INFO)
+
+        # create a logger for this TestSuite
+        self.test_logger = logging.getLogger(__name__)
+
+        # set the test logger level
+        self.test_logger.setLevel(logging.DEBUG)
+
+        # enable/disable the log output of the device logger for the tests
+        # if enabled log data inside this test will be printed
+        self.test_logger.disabled = False
+
+        # skip the UART setup of the constructor, provide the used members
+        self._serial = object.__new__(Serial)
+        self._serial._uart = RecordingUART()
+        self._serial._ctrlPin = None
+        self._serial._has_uart_flush = True
+        self._serial._t1char = 1
+        self._serial._frame_buf = bytearray(Const.MAX_RTU_ADU_LENGTH)
+        self._serial._rx_buf = bytearray(Const.MAX_RTU_ADU_LENGTH)
+        self._serial._rx_mv = memoryview(self._serial._rx_buf)
+        self._serial._inter_frame_delay = 1000
+
+    def test__send(self) -> None:
+        """Test assembly of the Modbus ADU in the shared frame buffer"""
+        self._serial._send(modbus_pdu=b'\x03\x00\x00\x00\x0A', slave_addr=1)
+        expectation = b'\x01\x03\x00\x00\x00\x0A\xC5\xCD'
+
+        self.assertEqual(len(self._serial._uart.written), 1)
+        self.assertEqual(self._serial._uart.written[0], expectation)
+        self.assertEqual(bytes(self._serial._frame_buf[:len(expectation)]),
+                         expectation)
+
+        # a shorter frame shall not contain data of the previous frame
+        self._serial._send(modbus_pdu=b'\x83\x02', slave_addr=1)
+        expectation = b'\x01\x83\x02\xC0\xF1'
+
+        self.assertEqual(len(self._serial._uart.written), 2)
+        self.assertEqual(self._serial._uart.written[1], expectation)
+
+        # the ADU shall not exceed the maximum RTU ADU length
+        with self.assertRaises(ValueError):
+            self._serial._send(
+                modbus_pdu=bytes(Const.MAX_RTU_ADU_LENGTH - 2),
+                slave_addr=1)
+
+        self.assertEqual(len(self._serial._uart.written), 2)
+
+    def test__calculate_crc16(self) -> None:
+        """Test CRC16 calculation of native code and Python implementation"""
+        test_vectors = [
+            (b'\x01\x03\x00\x00\x00\x0A', b'\xC5\xCD'),
+            (b'\x01\x83\x02', b'\xC0\xF1'),
+            (memoryview(b'\xFF\x01\x83\x02')[1:], b'\xC0\xF1'),
+            (b'', b'\xFF\xFF'),
+        ]
+
+        # native code implementation is not available on all ports
+        crc16_native = serial_module._crc16_native
+        implementations = [None]
+        if crc16_native is not None:
+            implementations.append(crc16_native)
+
+        try:
+            for implementation in implementations:
+                serial_module._crc16_native = implementation
+
+                for data, expectation in test_vectors:
+                    result = self._serial._calculate_crc16(data)
+                    self.assertIsInstance(result, bytes)
+                    self.assertEqual(result, expectation)
+        finally:
+            serial_module._crc16_native = crc16_native
+
+    def test__uart_read_frame(self) -> None:
+        """Test reading of frames into the preallocated receive buffer"""
+        frame = b'\x0A\x03\x00\x01\x00\x02\x94\xB0'
+        self._serial._uart = BufferedUART([frame[:3], frame[3:]])
+
+        result = self._serial._uart_read_frame()
+        self.assertEqual(result, frame)
+
+        # a frame of the maximum ADU length is read completely
+        self._serial._uart = BufferedUART([
+            bytes(Const.MAX_RTU_ADU_LENGTH - 6), bytes(6)
+        ])
+
+        result = self._serial._uart_read_frame()
+        self.assertEqual(len(result), Const.MAX_RTU_ADU_LENGTH)
+
+        # a frame exceeding the maximum ADU length is consumed and dropped
+        self._serial._uart = BufferedUART([
+            bytes(Const.MAX_RTU_ADU_LENGTH), bytes(10), bytes(10)
+        ])
+
+        result = self._serial._uart_read_frame()
+        self.assertEqual(len(result), 0)
+        self.assertEqual(self._serial._uart.any(), 0)
+
+    def tearDown(self) -> None:
+        """Run after every test method"""
+        pass
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -103,6 +103,8 @@ ERROR_RESP_LEN = const(0x05)
 FIXED_RESP_LEN = const(0x08)
 #: Modbus Application Protocol High Data Response length
 MBAP_HDR_LENGTH = const(0x07)
+#: Maximum RTU Application Data Unit length
+MAX_RTU_ADU_LENGTH = const(0x100)
 
 #: CRC16 lookup table
 CRC16_TABLE = (
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: UTF-8 -*-
+
+"""
+CRC16-Modbus calculation as native code
+
+This module requires a port with native code emitter, importing it fails on
+ports or firmwares built without one. Use it only with a fallback to
+:py:func:`umodbus.serial.Serial._calculate_crc16`
+
+Precompiling it to ``.mpy`` or freezing it into a firmware requires the
+target architecture to be given to ``mpy-cross`` by ``-march=<arch>``,
+otherwise compilation fails with ``SyntaxError: invalid arch``. The provided
+``manifest.py`` therefore freezes it only on request, see the installation
+documentation
+"""
+
+# system packages
+from array import array
+import micropython
+
+# custom packages
+from . import const as Const
+
+# lookup table as array to be accessible by pointer in viper code
+_CRC16_TABLE = array('H', Const.CRC16_TABLE)
+
+
+@micropython.viper
+def crc16(data) -> int:
+    """
+    Calculate the CRC16-Modbus checksum.
+
+    :param      data:        The data
+    :type       data:        Union[bytes, bytearray, memoryview]
+
+    :returns:   The crc 16.
+    :rtype:     int
+    """
+    buf = ptr8(data)                # noqa: F821
+    table = ptr16(_CRC16_TABLE)     # noqa: F821
+    n = int(len(data))
+    crc = 0xFFFF
+    i = 0
+
+    while i < n:
+        crc = (crc >> 8) ^ int(table[(crc ^ int(buf[i])) & 0xFF])
+        i += 1
+
+    return crc
@@ -51,59 +51,49 @@ class Modbus(object):
         for reg_type in self._changeable_register_types:
             self._changed_registers[reg_type] = dict()
 
-    def process(self) -> bool:
-        """
-        Process the Modbus requests.
-
-        :returns:   Result of processing, True on success, False otherwise
-        :rtype:     bool
-        """
-        reg_type = None
-        req_type = None
-
-        request = self._itf.get_request(unit_addr_list=self._addr_list,
-                                        timeout=0)
-        if request is None:
-            return False
-
-        if request.function == Const.READ_COILS:
+        # register type and access type of each supported function code
+        self._function_code_map = {
             # Coils (setter+getter) [0, 1]
             # function 01 - read single register
-            reg_type = 'COILS'
-            req_type = 'READ'
-        elif request.function == Const.READ_DISCRETE_INPUTS:
+            Const.READ_COILS: ('COILS', 'READ'),
             # Ists (only getter) [0, 1]
             # function 02 - read input status (discrete inputs/digital input)
-            reg_type = 'ISTS'
-            req_type = 'READ'
-        elif request.function == Const.READ_HOLDING_REGISTERS:
+            Const.READ_DISCRETE_INPUTS: ('ISTS', 'READ'),
             # Hregs (setter+getter) [0, 65535]
             # function 03 - read holding register
-            reg_type = 'HREGS'
-            req_type = 'READ'
-        elif request.function == Const.READ_INPUT_REGISTER:
+            Const.READ_HOLDING_REGISTERS: ('HREGS', 'READ'),
             # Iregs (only getter) [0, 65535]
             # function 04 - read input registers
-            reg_type = 'IREGS'
-            req_type = 'READ'
-        elif (request.function == Const.WRITE_SINGLE_COIL or
-                request.function == Const.WRITE_MULTIPLE_COILS):
+            Const.READ_INPUT_REGISTER: ('IREGS', 'READ'),
             # Coils (setter+getter) [0, 1]
             # function 05 - write single coil
             # function 15 - write multiple coil
-            reg_type = 'COILS'
-            req_type = 'WRITE'
-        elif (request.function == Const.WRITE_SINGLE_REGISTER or
-                request.function == Const.WRITE_MULTIPLE_REGISTERS):
+            Const.WRITE_SINGLE_COIL: ('COILS', 'WRITE'),
+            Const.WRITE_MULTIPLE_COILS: ('COILS', 'WRITE'),
             # Hregs (setter+getter) [0, 65535]
             # function 06 - write holding register
             # function 16 - write multiple holding register
-            reg_type = 'HREGS'
-            req_type = 'WRITE'
-        else:
-            request.send_exception(Const.ILLEGAL_FUNCTION)
+            Const.WRITE_SINGLE_REGISTER: ('HREGS', 'WRITE'),
+            Const.WRITE_MULTIPLE_REGISTERS: ('HREGS', 'WRITE'),
+        }
 
-        if reg_type:
+    def process(self) -> bool:
+        """
+        Process the Modbus requests.
+
+        :returns:   Result of processing, True on success, False otherwise
+        :rtype:     bool
+        """
+        request = self._itf.get_request(unit_addr_list=self._addr_list,
+                                        timeout=0)
+        if request is None:
+            return False
+
+        reg_type, req_type = self._function_code_map.get(request.function,
+                                                         (None, None))
+        if reg_type is None:
+            request.send_exception(Const.ILLEGAL_FUNCTION)
+        else:
             if req_type == 'READ':
                 self._process_read_access(request=request, reg_type=reg_type)
             elif req_type == 'WRITE':
@@ -126,12 +116,9 @@ class Modbus(object):
         :rtype:     Union[List[bool], List[int]]
         """
         data = []
-        default_value = {'val': 0}
+        default_value = {'val': self._default_vals[reg_type]}
         reg_dict = self._register_dict[reg_type]
 
-        if reg_type in ['COILS', 'ISTS']:
-            default_value = {'val': False}
-
         for addr in range(request.register_addr,
                           request.register_addr + request.quantity):
             value = reg_dict.get(addr, default_value)['val']
@@ -180,13 +167,13 @@ class Modbus(object):
         :type       reg_type:  str
         """
         address = request.register_addr
+        register = self._register_dict[reg_type].get(address)
 
-        if address in self._register_dict[reg_type]:
-
-            if self._register_dict[reg_type][address].get('on_get_cb', 0):
+        if register is not None:
+            _cb = register.get('on_get_cb', 0)
+            if _cb:
                 vals = self._create_response(request=request,
                                              reg_type=reg_type)
-                _cb = self._register_dict[reg_type][address]['on_get_cb']
                 _cb(reg_type=reg_type, address=address, val=vals)
 
             vals = self._create_response(request=request, reg_type=reg_type)
@@ -206,8 +193,9 @@ class Modbus(object):
         address = request.register_addr
         val = 0
         valid_register = False
+        register = self._register_dict[reg_type].get(address)
 
-        if address in self._register_dict[reg_type]:
+        if register is not None:
             if request.data is None:
                 request.send_exception(Const.ILLEGAL_DATA_VALUE)
                 return
@@ -247,8 +235,8 @@ class Modbus(object):
                 self._set_changed_register(reg_type=reg_type,
                                            address=address,
                                            value=val)
-                if self._register_dict[reg_type][address].get('on_set_cb', 0):
-                    _cb = self._register_dict[reg_type][address]['on_set_cb']
+                _cb = register.get('on_set_cb', 0)
+                if _cb:
                     _cb(reg_type=reg_type, address=address, val=val)
         else:
             request.send_exception(Const.ILLEGAL_DATA_ADDRESS)
@@ -24,6 +24,13 @@ from .modbus import Modbus
 # typing not natively supported on MicroPython
 from .typing import List, Optional, Union
 
+try:
+    # native code CRC16 calculation, requires a native code emitter
+    from .crc16 import crc16 as _crc16_native
+except Exception:
+    # e.g. SyntaxError on ports or firmwares without native code emitter
+    _crc16_native = None
+
 
 class ModbusRTU(Modbus):
     """
@@ -39,12 +46,16 @@ class ModbusRTU(Modbus):
     :type       stop_bits:   int
     :param      parity:      The parity, default None
     :type       parity:      Optional[int]
-    :param      pins:        The pins as list [TX, RX]
-    :type       pins:        List[Union[int, Pin], Union[int, Pin]]
+    :param      pins:        The pins as list [TX, RX], given as GPIO number,
+                             pin name or Pin object
+    :type       pins:        List[Union[int, str, Pin], Union[int, str, Pin]]
     :param      ctrl_pin:    The control pin
     :type       ctrl_pin:    int
     :param      uart_id:     The ID of the used UART
     :type       uart_id:     int
+    :param      rxbuf:       The UART receive buffer size, default None to
+                             use the port default, not supported by all ports
+    :type       rxbuf:       Optional[int]
     """
     def __init__(self,
                  addr: int,
@@ -52,9 +63,10 @@ class ModbusRTU(Modbus):
                  data_bits: int = 8,
                  stop_bits: int = 1,
                  parity: Optional[int] = None,
-                 pins: List[Union[int, Pin], Union[int, Pin]] = None,
+                 pins: List[Union[int, str, Pin], Union[int, str, Pin]] = None,
                  ctrl_pin: int = None,
-                 uart_id: int = 1):
+                 uart_id: int = 1,
+                 rxbuf: Optional[int] = None):
         super().__init__(
             # set itf to Serial object, addr_list to [addr]
             Serial(uart_id=uart_id,
@@ -63,7 +75,8 @@ class ModbusRTU(Modbus):
                    stop_bits=stop_bits,
                    parity=parity,
                    pins=pins,
-                   ctrl_pin=ctrl_pin),
+                   ctrl_pin=ctrl_pin,
+                   rxbuf=rxbuf),
             [addr]
         )
 
@@ -75,8 +88,9 @@ class Serial(CommonModbusFunctions):
                  data_bits: int = 8,
                  stop_bits: int = 1,
                  parity=None,
-                 pins: List[Union[int, Pin], Union[int, Pin]] = None,
-                 ctrl_pin: int = None):
+                 pins: List[Union[int, str, Pin], Union[int, str, Pin]] = None,
+                 ctrl_pin: int = None,
+                 rxbuf: Optional[int] = None):
         """
         Setup Serial/RTU Modbus
 
@@ -90,23 +104,45 @@ class Serial(CommonModbusFunctions):
         :type       stop_bits:   int
         :param      parity:      The parity, default None
         :type       parity:      Optional[int]
-        :param      pins:        The pins as list [TX, RX]
-        :type       pins:        List[Union[int, Pin], Union[int, Pin]]
+        :param      pins:        The pins as list [TX, RX], given as GPIO
+                                 number, pin name or Pin object
+        :type       pins:        List[Union[int, str, Pin], Union[int, str, Pin]]
         :param      ctrl_pin:    The control pin
         :type       ctrl_pin:    int
+        :param      rxbuf:       The UART receive buffer size, default None
+                                 to use the port default, not supported by
+                                 all ports
+        :type       rxbuf:       Optional[int]
         """
         # UART flush function is introduced in Micropython v1.20.0
         self._has_uart_flush = callable(getattr(UART, "flush", None))
-        self._uart = UART(uart_id,
-                          baudrate=baudrate,
-                          bits=data_bits,
-                          parity=parity,
-                          stop=stop_bits,
-                          # timeout_chars=2,  # WiPy only
-                          # pins=pins         # WiPy only
-                          tx=pins[0],
-                          rx=pins[1]
-                          )
+
+        # GPIO numbers and pin names are converted to Pin, as not all ports
+        # accept them for the UART, e.g. RP2 before MicroPython v1.21.0
+        tx_pin, rx_pin = [
+            pin if isinstance(pin, Pin) else Pin(pin) for pin in pins
+        ]
+        uart_config = {
+            'baudrate': baudrate,
+            'bits': data_bits,
+            'parity': parity,
+            'stop': stop_bits,
+            # 'timeout_chars': 2,   # WiPy only
+            # 'pins': pins,         # WiPy only
+            'tx': tx_pin,
+            'rx': rx_pin,
+        }
+        if rxbuf is not None:
+            # a larger buffer avoids data loss e.g. during GC pauses
+            uart_config['rxbuf'] = rxbuf
+
+        self._uart = UART(uart_id, **uart_config)
+
+        # preallocated buffer of the Modbus ADU to be sent
+        self._frame_buf = bytearray(Const.MAX_RTU_ADU_LENGTH)
+        # preallocated buffer of the received Modbus ADU
+        self._rx_buf = bytearray(Const.MAX_RTU_ADU_LENGTH)
+        self._rx_mv = memoryview(self._rx_buf)
 
         if ctrl_pin is not None:
             self._ctrlPin = Pin(ctrl_pin, mode=Pin.OUT)
@@ -134,10 +170,15 @@ class Serial(CommonModbusFunctions):
         :returns:   The crc 16.
         :rtype:     bytes
         """
+        if _crc16_native is not None:
+            return struct.pack('<H', _crc16_native(data))
+
         crc = 0xFFFF
+        # local reference avoids the module and attribute lookup per byte
+        crc16_table = Const.CRC16_TABLE
 
         for char in data:
-            crc = (crc >> 8) ^ Const.CRC16_TABLE[((crc) ^ char) & 0xFF]
+            crc = (crc >> 8) ^ crc16_table[(crc ^ char) & 0xFF]
 
         return struct.pack('<H', crc)
 
@@ -172,7 +213,8 @@ class Serial(CommonModbusFunctions):
         :returns:   Read content
         :rtype:     bytearray
         """
-        response = bytearray()
+        response_len = 0
+        rx_buf_len = len(self._rx_buf)
 
         # TODO: use some kind of hint or user-configurable delay
         #       to determine this loop counter
@@ -180,16 +222,20 @@ class Serial(CommonModbusFunctions):
             if self._uart.any():
                 # WiPy only
                 # response.extend(self._uart.readall())
-                response.extend(self._uart.read())
+                # read into the preallocated buffer instead of allocating
+                read_len = self._uart.readinto(self._rx_mv[response_len:])
+                if read_len:
+                    response_len += read_len
 
                 # variable length function codes may require multiple reads
-                if self._exit_read(response):
+                if (self._exit_read(self._rx_mv[:response_len]) or
+                        response_len >= rx_buf_len):
                     break
 
             # wait for the maximum time between two frames
             time.sleep_us(self._inter_frame_delay)
 
-        return response
+        return self._rx_buf[:response_len]
 
     def _uart_read_frame(self, timeout: Optional[int] = None) -> bytearray:
         """
@@ -201,7 +247,9 @@ class Serial(CommonModbusFunctions):
         :returns:   Received message
         :rtype:     bytearray
         """
-        received_bytes = bytearray()
+        received_len = 0
+        rx_buf_len = len(self._rx_buf)
+        is_oversized = False
 
         # set default timeout to at twice the inter-frame delay
         if timeout == 0 or timeout is None:
@@ -221,23 +269,35 @@ class Serial(CommonModbusFunctions):
                 while time.ticks_diff(time.ticks_us(), last_byte_ts) <= self._inter_frame_delay:
                     # WiPy only
                     # r = self._uart.readall()
-                    r = self._uart.read()
+                    if received_len >= rx_buf_len:
+                        # consume the rest of a frame exceeding the maximum
+                        # ADU length, it would be taken as start of the next
+                        if self._uart.read() is not None:
+                            is_oversized = True
+                            last_byte_ts = time.ticks_us()
+                        continue
+
+                    r = self._uart.readinto(self._rx_mv[received_len:])
 
                     # if something has been read after the first iteration of
                     # this inner while loop (within self._inter_frame_delay)
-                    if r is not None:
-                        # append the new read stuff to the buffer
-                        received_bytes.extend(r)
+                    if r:
+                        # the new read stuff is appended to the buffer
+                        received_len += r
 
                         # update the timestamp of the last byte being read
                         last_byte_ts = time.ticks_us()
 
             # if something has been read before the overall timeout is reached
-            if len(received_bytes) > 0:
-                return received_bytes
+            if received_len > 0:
+                break
+
+        if is_oversized:
+            # drop the invalid frame completely
+            received_len = 0
 
         # return the result in case the overall timeout has been reached
-        return received_bytes
+        return self._rx_buf[:received_len]
 
     def _send(self, modbus_pdu: bytes, slave_addr: int) -> None:
         """
@@ -252,10 +312,17 @@ class Serial(CommonModbusFunctions):
         """
         # modbus_adu: Modbus Application Data Unit
         # consists of the Modbus PDU, with slave address prepended and checksum appended
-        modbus_adu = bytearray()
-        modbus_adu.append(slave_addr)
-        modbus_adu.extend(modbus_pdu)
-        modbus_adu.extend(self._calculate_crc16(modbus_adu))
+        # it is assembled in the preallocated frame buffer and sent at once
+        frame_len = 1 + len(modbus_pdu)
+        adu_len = frame_len + Const.CRC_LENGTH
+        if adu_len > len(self._frame_buf):
+            raise ValueError('Modbus ADU exceeds {} bytes'.
+                             format(len(self._frame_buf)))
+
+        modbus_adu = memoryview(self._frame_buf)[:adu_len]
+        modbus_adu[0] = slave_addr
+        modbus_adu[1:frame_len] = modbus_pdu
+        modbus_adu[frame_len:] = self._calculate_crc16(modbus_adu[:frame_len])
 
         if self._ctrlPin:
             self._ctrlPin.on()
@@ -280,7 +347,7 @@ class Serial(CommonModbusFunctions):
             time.sleep_us(self._t1char)
         else:
             sleep_time_us = (
-                self._t1char * len(modbus_adu) -    # total frame time in us
+                self._t1char * adu_len -            # total frame time in us
                 time.ticks_diff(send_finish_time, send_start_time) +
                 100     # only required at baudrates above 57600, but hey 100us
             )
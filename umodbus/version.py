@@ -1,5 +1,5 @@
 #!/usr/bin/env python3
 # -*- coding: UTF-8 -*-
 
-__version_info__ = ("2", "3", "7")
+__version_info__ = ("2", "4", "0")
 __version__ = '.'.join(__version_info__)